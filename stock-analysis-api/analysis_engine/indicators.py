@@ -2,74 +2,93 @@ import pandas as pd
 import numpy as np
 from typing import Tuple
 
+from analysis_engine.indicators_numba import (
+    _rolling_mean, _rolling_std, _rolling_min, _rolling_max,
+    _ewm_mean, _rsi, _macd, _bollinger_bands, _mean_abs_dev,
+)
+
 class TechnicalIndicators:
     """Collection of technical indicator calculations"""
-    
+
     @staticmethod
     def rsi(prices: pd.Series, window: int = 14) -> pd.Series:
         """Calculate RSI with improved precision"""
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=window, min_periods=1).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=window, min_periods=1).mean()
-        
-        rs = gain / loss.replace(0, np.inf)
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
-    
+        values = _rsi(prices.to_numpy(), window)
+        return pd.Series(values, index=prices.index)
+
     @staticmethod
     def macd(prices: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[pd.Series, pd.Series, pd.Series]:
         """Calculate MACD with histogram"""
-        exp1 = prices.ewm(span=fast).mean()
-        exp2 = prices.ewm(span=slow).mean()
-        macd_line = exp1 - exp2
-        signal_line = macd_line.ewm(span=signal).mean()
-        histogram = macd_line - signal_line
-        return macd_line, signal_line, histogram
-    
+        macd_line, signal_line, histogram = _macd(
+            prices.to_numpy(), fast, slow, signal
+        )
+        return (pd.Series(macd_line, index=prices.index),
+                pd.Series(signal_line, index=prices.index),
+                pd.Series(histogram, index=prices.index))
+
     @staticmethod
     def bollinger_bands(prices: pd.Series, window: int = 20, std_dev: float = 2.0) -> Tuple[pd.Series, pd.Series, pd.Series]:
         """Calculate Bollinger Bands"""
-        sma = prices.rolling(window=window).mean()
-        std = prices.rolling(window=window).std()
-        upper_band = sma + (std * std_dev)
-        lower_band = sma - (std * std_dev)
-        return upper_band, sma, lower_band
-    
+        upper, middle, lower, _ = TechnicalIndicators.bollinger_bands_with_width(
+            prices, window, std_dev
+        )
+        return upper, middle, lower
+
+    @staticmethod
+    def bollinger_bands_with_width(prices: pd.Series, window: int = 20, std_dev: float = 2.0) -> Tuple[pd.Series, pd.Series, pd.Series, pd.Series]:
+        """Calculate Bollinger Bands plus band width (% of middle band)"""
+        upper, middle, lower, width = _bollinger_bands(
+            prices.to_numpy(), window, std_dev
+        )
+        return (pd.Series(upper, index=prices.index),
+                pd.Series(middle, index=prices.index),
+                pd.Series(lower, index=prices.index),
+                pd.Series(width, index=prices.index))
+
     @staticmethod
     def stochastic(high: pd.Series, low: pd.Series, close: pd.Series, k_window: int = 14, d_window: int = 3) -> Tuple[pd.Series, pd.Series]:
         """Calculate Stochastic Oscillator"""
-        lowest_low = low.rolling(window=k_window).min()
-        highest_high = high.rolling(window=k_window).max()
-        k_percent = 100 * (close - lowest_low) / (highest_high - lowest_low)
-        d_percent = k_percent.rolling(window=d_window).mean()
-        return k_percent, d_percent
-    
+        lowest_low = _rolling_min(low.to_numpy(), k_window)
+        highest_high = _rolling_max(high.to_numpy(), k_window)
+        k_percent = 100 * (close.to_numpy() - lowest_low) / (highest_high - lowest_low)
+        d_percent = _rolling_mean(k_percent, d_window, d_window)
+        return (pd.Series(k_percent, index=close.index),
+                pd.Series(d_percent, index=close.index))
+
     @staticmethod
     def williams_r(high: pd.Series, low: pd.Series, close: pd.Series, window: int = 14) -> pd.Series:
         """Calculate Williams %R"""
-        highest_high = high.rolling(window=window).max()
-        lowest_low = low.rolling(window=window).min()
-        williams_r = -100 * (highest_high - close) / (highest_high - lowest_low)
-        return williams_r
-    
+        highest_high = _rolling_max(high.to_numpy(), window)
+        lowest_low = _rolling_min(low.to_numpy(), window)
+        williams_r = -100 * (highest_high - close.to_numpy()) / (highest_high - lowest_low)
+        return pd.Series(williams_r, index=close.index)
+
     @staticmethod
     def atr(high: pd.Series, low: pd.Series, close: pd.Series, window: int = 14) -> pd.Series:
         """Calculate Average True Range"""
-        high_low = high - low
-        high_close = np.abs(high - close.shift())
-        low_close = np.abs(low - close.shift())
-        
-        true_range = np.maximum(high_low, np.maximum(high_close, low_close))
-        atr = true_range.rolling(window=window).mean()
-        return atr
-    
+        h = high.to_numpy()
+        l = low.to_numpy()
+        c = close.to_numpy()
+
+        # Previous close, NaN-padded like close.shift()
+        prev_close = np.empty_like(c)
+        prev_close[0] = np.nan
+        prev_close[1:] = c[:-1]
+
+        # True range in one vectorized pass, recycling a single buffer
+        true_range = np.empty_like(h)
+        np.maximum(np.abs(h - prev_close), np.abs(l - prev_close), out=true_range)
+        np.maximum(h - l, true_range, out=true_range)
+
+        atr = _rolling_mean(true_range, window, window)
+        return pd.Series(atr, index=close.index)
+
     @staticmethod
     def cci(high: pd.Series, low: pd.Series, close: pd.Series, window: int = 20) -> pd.Series:
         """Calculate Commodity Channel Index"""
         typical_price = (high + low + close) / 3
-        sma = typical_price.rolling(window=window).mean()
-        mean_deviation = typical_price.rolling(window=window).apply(
-            lambda x: np.mean(np.abs(x - np.mean(x)))
-        )
-        cci = (typical_price - sma) / (0.015 * mean_deviation)
-        return cci
+        tp_values = typical_price.to_numpy()
+        sma = _rolling_mean(tp_values, window, window)
+        mean_deviation = _mean_abs_dev(tp_values, window)
+        cci = (tp_values - sma) / (0.015 * mean_deviation)
+        return pd.Series(cci, index=close.index)
@@ -0,0 +1,263 @@
+"""
+Numba-compiled single-pass kernels backing TechnicalIndicators.
+
+Each kernel takes and returns plain NumPy float arrays (float32 or
+float64; output dtype follows the input) and replaces a
+pandas rolling/ewm pipeline with an O(n) streaming loop: running sums for
+means, sum + sum-of-squares for std, and a monotonic deque for min/max.
+Kernels are compiled with cache=True so the JIT cost is paid once per
+machine, and warmed up at import so it never lands on a request. They
+also release the GIL (nogil=True) so independent indicators can run
+concurrently on a thread pool.
+
+NaN handling mirrors pandas: windows are evaluated on the count of non-NaN
+observations against min_periods. fastmath is deliberately left off because
+it would let LLVM assume NaNs never occur and break that bookkeeping.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, nogil=True)
+def _rolling_mean(x, window, min_periods):
+    """Rolling mean via a running sum with NaN-aware observation counts"""
+    n = x.shape[0]
+    out = np.full(n, np.nan, x.dtype)
+    total = 0.0
+    count = 0
+    for i in range(n):
+        v = x[i]
+        if not np.isnan(v):
+            total += v
+            count += 1
+        if i >= window:
+            old = x[i - window]
+            if not np.isnan(old):
+                total -= old
+                count -= 1
+        if count >= min_periods and count > 0:
+            out[i] = total / count
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _rolling_std(x, window, min_periods):
+    """Rolling sample std (ddof=1) from running sum and sum-of-squares"""
+    n = x.shape[0]
+    out = np.full(n, np.nan, x.dtype)
+    total = 0.0
+    total_sq = 0.0
+    count = 0
+    for i in range(n):
+        v = x[i]
+        if not np.isnan(v):
+            total += v
+            total_sq += v * v
+            count += 1
+        if i >= window:
+            old = x[i - window]
+            if not np.isnan(old):
+                total -= old
+                total_sq -= old * old
+                count -= 1
+        if count >= min_periods and count >= 2:
+            var = (total_sq - total * total / count) / (count - 1)
+            if var < 0.0:
+                var = 0.0
+            out[i] = np.sqrt(var)
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _mean_abs_dev(x, window):
+    """Rolling mean absolute deviation around each window's own mean.
+
+    The window mean comes from a running sum; only the abs-deviation sum
+    needs an inner loop over the trailing window, which LLVM vectorizes.
+    Replaces a per-window Python rolling.apply callback.
+    """
+    n = x.shape[0]
+    out = np.full(n, np.nan, x.dtype)
+    total = 0.0
+    count = 0
+    for i in range(n):
+        v = x[i]
+        if not np.isnan(v):
+            total += v
+            count += 1
+        if i >= window:
+            old = x[i - window]
+            if not np.isnan(old):
+                total -= old
+                count -= 1
+        if count >= window:
+            mean = total / count
+            dev = 0.0
+            for j in range(i - window + 1, i + 1):
+                dev += abs(x[j] - mean)
+            out[i] = dev / window
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _rolling_min(x, window):
+    """Rolling min via a monotonic deque of candidate indices, O(1) amortized"""
+    n = x.shape[0]
+    out = np.full(n, np.nan, x.dtype)
+    deque = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    nan_count = 0
+    for i in range(n):
+        v = x[i]
+        if np.isnan(v):
+            nan_count += 1
+        else:
+            while tail > head and x[deque[tail - 1]] >= v:
+                tail -= 1
+            deque[tail] = i
+            tail += 1
+        if i >= window and np.isnan(x[i - window]):
+            nan_count -= 1
+        while tail > head and deque[head] <= i - window:
+            head += 1
+        if i >= window - 1 and nan_count == 0:
+            out[i] = x[deque[head]]
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _rolling_max(x, window):
+    """Rolling max via a monotonic deque of candidate indices, O(1) amortized"""
+    n = x.shape[0]
+    out = np.full(n, np.nan, x.dtype)
+    deque = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    nan_count = 0
+    for i in range(n):
+        v = x[i]
+        if np.isnan(v):
+            nan_count += 1
+        else:
+            while tail > head and x[deque[tail - 1]] <= v:
+                tail -= 1
+            deque[tail] = i
+            tail += 1
+        if i >= window and np.isnan(x[i - window]):
+            nan_count -= 1
+        while tail > head and deque[head] <= i - window:
+            head += 1
+        if i >= window - 1 and nan_count == 0:
+            out[i] = x[deque[head]]
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _bollinger_bands(x, window, num_std):
+    """Upper/middle/lower bands and width in one fused pass.
+
+    Maintains the running sum and sum-of-squares once instead of sweeping
+    the price array separately for mean and std, and derives the band
+    width (as % of the middle band) in the same loop.
+    """
+    n = x.shape[0]
+    upper = np.full(n, np.nan, x.dtype)
+    middle = np.full(n, np.nan, x.dtype)
+    lower = np.full(n, np.nan, x.dtype)
+    width = np.full(n, np.nan, x.dtype)
+    total = 0.0
+    total_sq = 0.0
+    count = 0
+    for i in range(n):
+        v = x[i]
+        if not np.isnan(v):
+            total += v
+            total_sq += v * v
+            count += 1
+        if i >= window:
+            old = x[i - window]
+            if not np.isnan(old):
+                total -= old
+                total_sq -= old * old
+                count -= 1
+        if count >= window and count >= 2:
+            mean = total / count
+            var = (total_sq - total * mean) / (count - 1)
+            if var < 0.0:
+                var = 0.0
+            band = num_std * np.sqrt(var)
+            upper[i] = mean + band
+            middle[i] = mean
+            lower[i] = mean - band
+            width[i] = 2.0 * band / mean * 100.0
+    return upper, middle, lower, width
+
+
+@njit(cache=True, nogil=True)
+def _ewm_mean(x, span):
+    """Exponentially weighted mean, matching pandas ewm(span=...) adjust=True"""
+    n = x.shape[0]
+    out = np.empty(n, x.dtype)
+    alpha = 2.0 / (span + 1.0)
+    decay = 1.0 - alpha
+    num = 0.0
+    den = 0.0
+    for i in range(n):
+        num = num * decay + x[i]
+        den = den * decay + 1.0
+        out[i] = num / den
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _rsi(prices, window):
+    """RSI from streaming rolling means of gains and losses"""
+    n = prices.shape[0]
+    gains = np.zeros(n, prices.dtype)
+    losses = np.zeros(n, prices.dtype)
+    for i in range(1, n):
+        delta = prices[i] - prices[i - 1]
+        if delta > 0:
+            gains[i] = delta
+        elif delta < 0:
+            losses[i] = -delta
+    avg_gain = _rolling_mean(gains, window, 1)
+    avg_loss = _rolling_mean(losses, window, 1)
+    out = np.empty(n, prices.dtype)
+    for i in range(n):
+        # Algebraic identity for 100 - 100/(1 + gain/loss): one division,
+        # no zero-loss sentinel, neutral 50 when the window is flat
+        denom = avg_gain[i] + avg_loss[i]
+        if denom > 0.0:
+            out[i] = 100.0 * avg_gain[i] / denom
+        else:
+            out[i] = 50.0
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _macd(prices, fast, slow, signal):
+    """MACD line, signal line and histogram in three EWM passes"""
+    macd_line = _ewm_mean(prices, fast) - _ewm_mean(prices, slow)
+    signal_line = _ewm_mean(macd_line, signal)
+    return macd_line, signal_line, macd_line - signal_line
+
+
+def _warmup():
+    """Trigger compilation of every kernel on tiny inputs at import time"""
+    for dtype in (np.float64, np.float32):
+        dummy = np.array([1.0, 2.0], dtype=dtype)
+        _rolling_mean(dummy, 2, 1)
+        _rolling_std(dummy, 2, 2)
+        _bollinger_bands(dummy, 2, 2.0)
+        _mean_abs_dev(dummy, 2)
+        _rolling_min(dummy, 2)
+        _rolling_max(dummy, 2)
+        _ewm_mean(dummy, 2)
+        _rsi(dummy, 2)
+        _macd(dummy, 1, 2, 1)
+
+
+_warmup()
@@ -1,8 +1,12 @@
+import asyncio
+
 from fastapi import FastAPI, Query, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from cachetools import TTLCache
 from analysis_engine.analyzer import ProfessionalStockAnalyzer
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -11,17 +15,31 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Short-lived cache of final response payloads: warm hits skip the download
+# and all indicator/signal recomputation
+_response_cache = TTLCache(maxsize=256, ttl=60)
+
 @app.get("/analyze")
-def analyze(
+async def analyze(
     symbol: str = Query(..., description="Stock symbol, e.g. AAPL"),
     period: str = Query("1y", description="Data period, e.g. 1y, 6mo"),
     account_balance: float = Query(100000, description="Account balance for risk metrics")
 ):
+    cache_key = (symbol.upper(), period, account_balance)
+    cached = _response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        analyzer = ProfessionalStockAnalyzer(symbol, period)
-        analyzer.calculate_all_indicators()
-        analyzer.generate_advanced_signals()
-        analyzer.calculate_risk_metrics(account_balance)
-        return analyzer.get_json_output()
+        # The blocking yfinance download and indicator pipeline run on a
+        # worker thread so the event loop keeps serving other requests;
+        # analyze_cached's per-symbol locks fan concurrent bursts for the
+        # same symbol in to a single computation
+        result = await asyncio.to_thread(
+            ProfessionalStockAnalyzer.analyze_cached,
+            symbol, period, account_balance
+        )
+        _response_cache[cache_key] = result
+        return result
     except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=400, detail=str(e))